@@ -6,19 +6,36 @@
 # --------------------------------------------------------------------------
 
 import os
+import queue
 import subprocess
-# It's good practice to manage WebDriver installation.
-from webdriver_manager.chrome import ChromeDriverManager
+import threading
 from selenium.webdriver.chrome.service import Service
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-import chromedriver_autoinstaller
+
+# --- Configuration ---
+# Number of drivers kept alive by a BrowserPool.
+POOL_SIZE = int(os.getenv("POOL_SIZE", 2))
+# Drivers are recycled after this many uses to bound memory growth in Chrome.
+MAX_USES_PER_INSTANCE = 50
+CHROME_BINARY = "/usr/bin/chromium-browser"
+CHROMEDRIVER_PATH = "/usr/bin/chromedriver"
+# Requests headless scraping drivers never need: fonts, media and trackers.
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*segment.io*", "*hotjar.com*",
+]
+
+# Serializes install_chrome(), since pool drivers can start concurrently
+_install_lock = threading.Lock()
 
 
 # def initialize_driver(headless=False):
 #     """Initializes and returns a Selenium WebDriver instance with auto-matching ChromeDriver."""
 #
 #     # Install matching ChromeDriver for current system Chrome
+#     # (needs 'import chromedriver_autoinstaller')
 #     chromedriver_autoinstaller.install()
 #
 #     options = Options()
@@ -34,27 +51,187 @@ import chromedriver_autoinstaller
 #     return driver
 
 def install_chrome():
-    subprocess.run(["apt-get", "update"], check=True)
-    subprocess.run([
-        "apt-get", "install", "-y", "chromium-browser", "chromium-chromedriver"
-    ], check=True)
+    """
+    Installs Chromium and its driver with apt-get unless both are already
+    present, so only the first start on a fresh machine pays for it.
+    """
+    with _install_lock:
+        if os.path.exists(CHROME_BINARY) and os.path.exists(CHROMEDRIVER_PATH):
+            return
+        subprocess.run(["apt-get", "update"], check=True)
+        subprocess.run([
+            "apt-get", "install", "-y", "chromium-browser", "chromium-chromedriver"
+        ], check=True)
 
 def initialize_driver(headless=False):
     install_chrome()  # make sure Chrome is installed
 
     options = Options()
-    options.binary_location = "/usr/bin/chromium-browser"
+    options.binary_location = CHROME_BINARY
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
     if headless:
         options.add_argument("--headless=new")
+        # Nobody sees a headless page, so skip downloading and decoding its
+        # images (most of the bytes on job listing pages) and never show
+        # notification prompts.
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-background-networking")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        # Headless drivers only scrape, and the scraper explicitly waits for
+        # the elements it reads, so get() can return at DOMContentLoaded
+        # instead of waiting for every tracker and ad on the page.
+        options.page_load_strategy = "eager"
 
-    service = Service("/usr/bin/chromedriver")
+    service = Service(CHROMEDRIVER_PATH)
     driver = webdriver.Chrome(service=service, options=options)
+    if headless:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            # Blocking is only an optimization, the driver still works without it
+            print(f"Could not set blocked URLs on the browser: {e}")
     return driver
 
 
+def is_driver_alive(driver):
+    """
+    Checks whether a driver's browser is still reachable, e.g. that the user
+    hasn't closed the window, so it can be reused instead of starting a new one.
+    """
+    if driver is None:
+        return False
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+class BrowserPool:
+    """
+    A small, thread-safe pool of Selenium drivers that are kept alive and reused
+    across runs instead of paying the browser start-up cost every time.
+    """
+
+    def __init__(self, size=POOL_SIZE, headless=True):
+        self.size = size
+        self.headless = headless
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._created = 0
+        self._warming = False
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout=None):
+        """
+        Returns a healthy driver from the pool, starting a new one if the pool
+        has not reached its size yet. Blocks until a driver is released, or a
+        pre-warming driver has booted, otherwise.
+        """
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    # A driver being pre-warmed will be ready sooner than a new one
+                    can_create = self._created < self.size and not self._warming
+                    if can_create:
+                        self._created += 1
+                if can_create:
+                    try:
+                        driver = initialize_driver(headless=self.headless)
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                    with self._lock:
+                        self._uses[driver] = 0
+                    return driver
+                driver = self._idle.get(timeout=timeout)
+
+            if driver is None:
+                # A pre-warm failed; check again whether a driver can be created
+                continue
+            if is_driver_alive(driver):
+                return driver
+            print("Discarding an unresponsive pooled browser.")
+            self._discard(driver)
+
+    def prewarm(self):
+        """
+        Starts one driver in the background if none is idle, so the next
+        acquire() doesn't have to wait for the browser to boot.
+        """
+        with self._lock:
+            if self._warming or self._created >= self.size or not self._idle.empty():
+                return
+            self._warming = True
+            self._created += 1
+        threading.Thread(target=self._start_idle_driver, daemon=True).start()
+
+    def _start_idle_driver(self):
+        try:
+            driver = initialize_driver(headless=self.headless)
+        except Exception as e:
+            with self._lock:
+                self._created -= 1
+                self._warming = False
+            print(f"Could not pre-warm a browser: {e}")
+            # Wake up any acquire() waiting for this driver
+            self._idle.put(None)
+            return
+        with self._lock:
+            self._uses[driver] = 0
+            self._warming = False
+        self._idle.put(driver)
+
+    def release(self, driver):
+        """Returns a driver to the pool, recycling it once it has been used too often."""
+        if driver is None:
+            return
+        with self._lock:
+            # A driver discarded while checked out (by close_all) isn't returned
+            if driver not in self._uses:
+                return
+            self._uses[driver] += 1
+            worn_out = self._uses[driver] >= MAX_USES_PER_INSTANCE
+        if worn_out:
+            self._discard(driver)
+        else:
+            self._idle.put(driver)
+
+    def close_all(self):
+        """
+        Quits every driver the pool has started, including ones still checked
+        out. Meant for shutdown, e.g. registered with atexit.
+        """
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        with self._lock:
+            drivers = list(self._uses)
+        for driver in drivers:
+            self._discard(driver)
+
+    def _discard(self, driver):
+        with self._lock:
+            # A driver already discarded (e.g. by close_all) isn't counted twice
+            if self._uses.pop(driver, None) is not None:
+                self._created -= 1
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"An error occurred while closing a pooled browser: {e}")
+
+
 def start_application(driver, job_url):
     """
     Uses an existing browser session to navigate to the specified job URL.
@@ -1,79 +1,183 @@
 # src/database.py
+import atexit
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 
 # --- Configuration ---
 DB_FILE = "job_applications.db"
 
+# A single connection is shared by all callers (Streamlit runs each session in
+# its own thread), so the lock serializes access to it.
+_connection = None
+_connection_lock = threading.Lock()
+# Incremented on every write, see get_db_version()
+_db_version = 0
+
 
 # --- Database Functions ---
 
-def get_db_connection():
-    """
-    Establishes a connection to the SQLite database.
-    Creates the database file if it doesn't exist.
-    """
-    conn = sqlite3.connect(DB_FILE)
+def _open_connection():
+    """Opens the shared connection and applies the PRAGMAs it relies on."""
+    # Wait up to 10s for another process's write lock instead of failing at once
+    conn = sqlite3.connect(DB_FILE, timeout=10, check_same_thread=False)
     # This allows us to access columns by name
     conn.row_factory = sqlite3.Row
+    # WAL lets readers proceed while a write is in progress, and with WAL,
+    # synchronous=NORMAL is still safe but avoids an fsync on every commit.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    # ~20MB page cache (negative values are in KiB); the connection lives for the
+    # whole process, so hot pages stay cached between reruns.
+    conn.execute("PRAGMA cache_size=-20000")
     return conn
 
 
+@contextmanager
+def _db():
+    """
+    Gives the caller exclusive use of the shared connection to the SQLite
+    database for the duration of a 'with' block, opening it on first use.
+    Creates the database file if it doesn't exist.
+
+    Any transaction left open by a failed write is rolled back on exit, so it
+    doesn't leak into the next use.
+    """
+    global _connection
+    with _connection_lock:
+        if _connection is None:
+            _connection = _open_connection()
+        try:
+            yield _connection
+        finally:
+            if _connection.in_transaction:
+                _connection.rollback()
+
+
+def close_db_connection():
+    """
+    Closes the shared connection, if open. Registered to run at exit so the
+    WAL is checkpointed back into the database file.
+    """
+    global _connection
+    with _connection_lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+
+
+atexit.register(close_db_connection)
+
+
+def get_db_version():
+    """
+    Returns a counter that increases on every write made through this module.
+    Callers can use it as a cache key to know when cached job lists are stale.
+    """
+    return _db_version
+
+
+def _bump_db_version():
+    # Called while the connection lock is held, so increments are serialized
+    global _db_version
+    _db_version += 1
+
+
 def init_db():
     """
     Creates the 'applications' table if it doesn't already exist.
     This table will store all job data and application statuses.
     """
-    conn = get_db_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute('''
-                       CREATE TABLE IF NOT EXISTS applications
-                       (
-                           id
-                           INTEGER
-                           PRIMARY
-                           KEY
-                           AUTOINCREMENT,
-                           title
-                           TEXT
-                           NOT
-                           NULL,
-                           company
-                           TEXT
-                           NOT
-                           NULL,
-                           location
-                           TEXT,
-                           job_url
-                           TEXT
-                           UNIQUE,
-                           criteria
-                           TEXT,
-                           status
-                           TEXT
-                           NOT
-                           NULL
-                           DEFAULT
-                           'found',
-                           match_score
-                           INTEGER
-                           DEFAULT
-                           0,
-                           matched_skills
-                           TEXT,
-                           found_date
-                           TIMESTAMP
-                           DEFAULT
-                           CURRENT_TIMESTAMP
-                       )
-                       ''')
-        conn.commit()
-        print("Database initialized. Table 'applications' is ready.")
-    except Exception as e:
-        print(f"An error occurred while creating the table: {e}")
-    finally:
-        conn.close()
+    with _db() as conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           CREATE TABLE IF NOT EXISTS applications
+                           (
+                               id
+                               INTEGER
+                               PRIMARY
+                               KEY
+                               AUTOINCREMENT,
+                               title
+                               TEXT
+                               NOT
+                               NULL,
+                               company
+                               TEXT
+                               NOT
+                               NULL,
+                               location
+                               TEXT,
+                               job_url
+                               TEXT
+                               UNIQUE,
+                               criteria
+                               TEXT,
+                               status
+                               TEXT
+                               NOT
+                               NULL
+                               DEFAULT
+                               'found',
+                               match_score
+                               INTEGER
+                               DEFAULT
+                               0,
+                               matched_skills
+                               TEXT,
+                               found_date
+                               TIMESTAMP
+                               DEFAULT
+                               CURRENT_TIMESTAMP
+                           )
+                           ''')
+            # Every UI rerun filters by status and sorts by score. Indexing both lets
+            # get_jobs_by_status() read a page of rows already in order, with no scan
+            # or sort, and also serves plain status lookups and counts.
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_applications_status_score "
+                "ON applications (status, match_score DESC, id)"
+            )
+            # Refresh the query planner's statistics where they are out of date
+            cursor.execute("PRAGMA optimize")
+            conn.commit()
+            print("Database initialized. Table 'applications' is ready.")
+        except Exception as e:
+            print(f"An error occurred while creating the table: {e}")
+
+
+_INSERT_JOBS_SQL = """
+                  INSERT OR IGNORE INTO applications (
+                      title, company, location, job_url, criteria, match_score, matched_skills
+                  ) VALUES """
+_JOB_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?)"
+# Older SQLite builds allow at most 999 bound parameters per statement
+_MAX_ROWS_PER_INSERT = 999 // 7
+
+
+@lru_cache(maxsize=None)
+def _insert_jobs_sql(row_count):
+    """Returns a multi-row INSERT statement for 'row_count' jobs."""
+    return _INSERT_JOBS_SQL + ", ".join([_JOB_PLACEHOLDERS] * row_count)
+
+
+def _job_to_row(job_data):
+    """Converts a job dictionary into a parameter tuple for _insert_jobs_sql()."""
+    return (
+        job_data.get('title'),
+        job_data.get('company'),
+        job_data.get('location'),
+        job_data.get('job_url'),
+        job_data.get('criteria'),
+        # Ranked jobs carry their relevance as 'score'
+        job_data.get('match_score', job_data.get('score', 0)),
+        ', '.join(job_data.get('matched_skills', []))
+    )
 
 
 def add_job(job_data):
@@ -88,31 +192,43 @@ def add_job(job_data):
     Returns:
         bool: True if a new row was inserted, False otherwise.
     """
-    conn = get_db_connection()
-    try:
-        cursor = conn.cursor()
-        # Using INSERT OR IGNORE to prevent errors on duplicate URLs and adding the criteria
-        cursor.execute("""
-                       INSERT OR IGNORE INTO applications (
-                           title, company, location, job_url, criteria, match_score, matched_skills
-                       ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                       """, (
-                           job_data.get('title'),
-                           job_data.get('company'),
-                           job_data.get('location'),
-                           job_data.get('job_url'),
-                           job_data.get('criteria'),
-                           job_data.get('match_score', 0),
-                           ', '.join(job_data.get('matched_skills', []))
-                       ))
-        conn.commit()
-        # cursor.rowcount will be 1 if a row was inserted, 0 if it was ignored.
-        return cursor.rowcount > 0
-    except Exception as e:
-        print(f"An error occurred while adding a job: {e}")
-        return False
-    finally:
-        conn.close()
+    return add_jobs([job_data]) > 0
+
+
+def add_jobs(jobs):
+    """
+    Adds many jobs to the database in a single transaction.
+    Jobs already present (based on the unique job_url) are ignored.
+
+    Args:
+        jobs (iterable): Job dictionaries, as accepted by add_job(). A
+                         generator works too; rows are converted as they are inserted.
+
+    Returns:
+        int: The number of new rows inserted.
+    """
+    if not jobs:
+        return 0
+
+    with _db() as conn:
+        try:
+            cursor = conn.cursor()
+            rows = map(_job_to_row, jobs)
+            inserted = 0
+            # Using INSERT OR IGNORE to prevent errors on duplicate URLs, with a
+            # single commit (and fsync) for the whole batch. Each statement inserts
+            # many rows at once, which is cheaper than one execute per row.
+            while chunk := list(islice(rows, _MAX_ROWS_PER_INSERT)):
+                cursor.execute(_insert_jobs_sql(len(chunk)), [value for row in chunk for value in row])
+                # rowcount is the number of rows inserted, not counting ignored duplicates
+                inserted += cursor.rowcount
+            conn.commit()
+            if inserted > 0:
+                _bump_db_version()
+            return inserted
+        except Exception as e:
+            print(f"An error occurred while adding jobs: {e}")
+            return 0
 
 
 def update_job_status(job_id, new_status):
@@ -123,58 +239,99 @@ def update_job_status(job_id, new_status):
         job_id (int): The unique ID of the job to update.
         new_status (str): The new status (e.g., 'applied', 'interviewing').
     """
-    conn = get_db_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("UPDATE applications SET status = ? WHERE id = ?", (new_status, job_id))
-        conn.commit()
-        print(f"Updated job status to '{new_status}' for ID: {job_id}")
-    except Exception as e:
-        print(f"An error occurred while updating job status: {e}")
-    finally:
-        conn.close()
+    with _db() as conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("UPDATE applications SET status = ? WHERE id = ?", (new_status, job_id))
+            conn.commit()
+            _bump_db_version()
+            print(f"Updated job status to '{new_status}' for ID: {job_id}")
+        except Exception as e:
+            print(f"An error occurred while updating job status: {e}")
 
 
-def get_jobs_by_status(status="found"):
+def get_jobs_by_status(status="found", limit=None, offset=0):
     """
-    Retrieves all jobs from the database that have a specific status.
+    Retrieves jobs from the database that have a specific status.
 
     Args:
         status (str): The status to filter by.
+        limit (int, optional): The maximum number of jobs to return. All jobs
+                               are returned when omitted.
+        offset (int): The number of jobs to skip, for pagination.
 
     Returns:
-        list: A list of job dictionaries.
+        list: A list of job dictionaries, best matches first.
     """
-    conn = get_db_connection()
     jobs = []
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM applications WHERE status = ?", (status,))
-        rows = cursor.fetchall()
-        # Convert sqlite.Row objects to standard dictionaries
-        for row in rows:
-            jobs.append(dict(row))
-    except Exception as e:
-        print(f"An error occurred while fetching jobs: {e}")
-    finally:
-        conn.close()
+    with _db() as conn:
+        try:
+            cursor = conn.cursor()
+            query = "SELECT * FROM applications WHERE status = ? ORDER BY match_score DESC, id"
+            params = [status]
+            if limit is not None:
+                query += " LIMIT ? OFFSET ?"
+                params += [limit, offset]
+            cursor.execute(query, params)
+            # Convert sqlite.Row objects to standard dictionaries, which callers
+            # can copy, extend and cache (Row objects can't be pickled)
+            jobs = [dict(row) for row in cursor]
+        except Exception as e:
+            print(f"An error occurred while fetching jobs: {e}")
     return jobs
 
 
+def count_jobs_by_status(status="found"):
+    """
+    Counts the jobs in the database that have a specific status.
+
+    Args:
+        status (str): The status to filter by.
+
+    Returns:
+        int: The number of matching jobs.
+    """
+    count = 0
+    with _db() as conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM applications WHERE status = ?", (status,))
+            count = cursor.fetchone()[0]
+        except Exception as e:
+            print(f"An error occurred while counting jobs: {e}")
+    return count
+
+
+def get_known_urls():
+    """
+    Retrieves the set of job URLs already stored in the database.
+    Only the 'job_url' column is read, which keeps de-duplication cheap
+    even when the table holds many jobs.
+
+    Returns:
+        set: A set of job URL strings.
+    """
+    urls = set()
+    with _db() as conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT job_url FROM applications WHERE job_url IS NOT NULL")
+            urls = {row[0] for row in cursor}
+        except Exception as e:
+            print(f"An error occurred while fetching known job URLs: {e}")
+    return urls
+
+
 def get_all_jobs():
     """Retrieves all jobs from the database."""
-    conn = get_db_connection()
     jobs = []
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM applications")
-        rows = cursor.fetchall()
-        for row in rows:
-            jobs.append(dict(row))
-    except Exception as e:
-        print(f"An error occurred while fetching all jobs: {e}")
-    finally:
-        conn.close()
+    with _db() as conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM applications")
+            jobs = [dict(row) for row in cursor]
+        except Exception as e:
+            print(f"An error occurred while fetching all jobs: {e}")
     return jobs
 
 
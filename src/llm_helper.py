@@ -1,12 +1,50 @@
 # src/llm_helper.py
 import os
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src import matcher
 
 # --- Configuration ---
 # It is highly recommended to set your API key as an environment variable.
 API_KEY = os.getenv("GEMINI_API_KEY")
-API_URL = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-live:generateContent?key={API_KEY}"
+# The key is sent in a header rather than the URL, so it can't leak into error messages
+API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-live:generateContent"
+# Upper bound on concurrent API connections kept open (e.g. page-wide insights)
+MAX_CONNECTIONS = 10
+
+# Longest wait between retries, whether from backoff or a Retry-After header
+MAX_RETRY_WAIT = 4
+
+
+class _CappedRetry(Retry):
+    """Retry policy whose backoff and Retry-After waits never exceed MAX_RETRY_WAIT."""
+
+    def get_backoff_time(self):
+        return min(super().get_backoff_time(), MAX_RETRY_WAIT)
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_WAIT)
+
+
+# Rate limits, transient server errors and failed connections are retried with a
+# short exponential backoff. Read timeouts are not: the server may already have
+# run (and billed) the generation, and each retry could block for another 45s.
+_retry = _CappedRetry(
+    total=3,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)
+
+# A shared session keeps the TCP/TLS connection to the API alive between calls
+# instead of paying a new handshake for every request.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONNECTIONS, max_retries=_retry))
 
 
 def generate_talking_points_prompt(job, user_skills):
@@ -21,8 +59,7 @@ def generate_talking_points_prompt(job, user_skills):
         str: A formatted prompt string.
     """
     # Clean up the job criteria HTML for the prompt
-    soup = BeautifulSoup(job.get('criteria', ''), 'html.parser')
-    job_description = soup.get_text(separator=' ', strip=True)
+    job_description = matcher.description_text(job.get('criteria') or '')
 
     prompt = f"""
     You are a professional career coach. Analyze the provided job description and my skills.
@@ -53,8 +90,7 @@ def generate_application_text_prompt(job_details, resume_text):
         str: A formatted prompt string for generating application text.
     """
     # Clean up the job criteria HTML for the prompt
-    soup = BeautifulSoup(job_details.get('criteria', ''), 'html.parser')
-    job_description = soup.get_text(separator=' ', strip=True)
+    job_description = matcher.description_text(job_details.get('criteria') or '')
 
     prompt = f"""
     You are a world-class career coach and professional writer. Your task is to write a compelling, 2-3 paragraph summary for a job application based on my resume and the job description provided.
@@ -92,7 +128,7 @@ def get_ai_insights(prompt):
     if not API_KEY:
         return "Error: GEMINI_API_KEY is not set. Please set it in your .env file."
 
-    headers = {"Content-Type": "application/json"}
+    headers = {"Content-Type": "application/json", "x-goog-api-key": API_KEY}
     payload = {
         "contents": [{"parts": [{"text": prompt}]}],
         "generationConfig": {
@@ -102,7 +138,7 @@ def get_ai_insights(prompt):
     }
 
     try:
-        response = requests.post(API_URL, headers=headers, json=payload, timeout=45)
+        response = _session.post(API_URL, headers=headers, json=payload, timeout=45)
         response.raise_for_status()
         data = response.json()
         # Navigate the JSON response to get the text
@@ -1,9 +1,104 @@
 import re
-from bs4 import BeautifulSoup
+import html
+from functools import lru_cache
+
+# Matches any HTML tag; used to strip job descriptions down to text.
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+# --- Helper Functions ---
+
+def _html_to_text(criteria_html):
+    """
+    Strips tags from a job description and decodes HTML entities.
+    Tags are replaced with spaces so words from adjacent elements (e.g. list
+    items) don't run together and hide a skill from the word-boundary match.
+    """
+    # Plain-text descriptions have no tags to strip, so skip the regex substitution
+    if '<' not in criteria_html:
+        return html.unescape(criteria_html)
+    return html.unescape(_HTML_TAG_RE.sub(' ', criteria_html))
+
+
+@lru_cache(maxsize=8)
+def _build_skill_matcher(resume_skills):
+    """
+    Compiles a single alternation regex that finds every resume skill in one
+    pass over a text, instead of running one regex search per skill.
+
+    Args:
+        resume_skills (frozenset): The skills to search for.
+
+    Returns:
+        tuple: (pattern, shorter_prefixes) where 'pattern' matches the longest
+               skill starting at each word boundary and 'shorter_prefixes' maps
+               a skill to the compiled patterns of other skills it starts with.
+    """
+    # Longest first, so 'vue.js' wins over 'vue' at the same position
+    skills = sorted(resume_skills, key=len, reverse=True)
+    alternation = '|'.join(re.escape(skill) for skill in skills)
+    # The lookahead keeps matches zero-width so overlapping skills are all found
+    pattern = re.compile(r'\b(?=(' + alternation + r')\b)')
+
+    # A shorter skill sharing the same start (e.g. 'react' in 'react native')
+    # is hidden by the longer match, so it is re-checked explicitly.
+    shorter_prefixes = {}
+    for skill in skills:
+        prefixes = [(other, re.compile(re.escape(other) + r'\b'))
+                    for other in skills if other != skill and skill.startswith(other)]
+        if prefixes:
+            shorter_prefixes[skill] = prefixes
+    return pattern, shorter_prefixes
+
+
+def _find_skills(text, skill_matcher):
+    """Returns the set of skills that appear as whole words in the text."""
+    pattern, shorter_prefixes = skill_matcher
+    found = set()
+    for match in pattern.finditer(text):
+        skill = match.group(1)
+        found.add(skill)
+        for other, other_pattern in shorter_prefixes.get(skill, ()):
+            if other_pattern.match(text, match.start()):
+                found.add(other)
+    return found
 
 
 # --- Main Functions ---
 
+def find_skills_in_text(text, skills):
+    """
+    Finds which of the given skills appear as whole words in a text,
+    using a single pass over the text.
+
+    Args:
+        text (str): The lowercased text to search within.
+        skills (set): A set of lowercase skills to look for.
+
+    Returns:
+        set: The skills found in the text.
+    """
+    if not text or not skills:
+        return set()
+    return _find_skills(text, _build_skill_matcher(frozenset(skills)))
+
+
+@lru_cache(maxsize=128)
+def description_text(criteria_html):
+    """
+    Converts a job's 'criteria' HTML into readable plain text with normalized
+    whitespace, e.g. for building LLM prompts. Results are cached, so prompts
+    built repeatedly for the same job don't strip its HTML again.
+
+    Args:
+        criteria_html (str): The job description HTML (or plain text).
+
+    Returns:
+        str: The description text.
+    """
+    return ' '.join(_html_to_text(criteria_html).split())
+
+
 def score_job_relevance(job, resume_skills):
     """
     Scores a job based on skill matches in title and description.
@@ -16,25 +111,23 @@ def score_job_relevance(job, resume_skills):
     Returns:
         tuple: A tuple containing (score, matched_skills_set).
     """
-    total_score = 0
-    total_found_skills = set()
+    if not resume_skills:
+        return 0, set()
+
+    skill_matcher = _build_skill_matcher(frozenset(resume_skills))
 
     # Score based on job title (higher weight)
     title = str(job.get('title', '')).lower()
-    for skill in resume_skills:
-        if re.search(r'\b' + re.escape(skill) + r'\b', title):
-            total_score += 2  # Higher weight for skills in the title
-            total_found_skills.add(skill)
+    title_skills = _find_skills(title, skill_matcher)
 
     # Score based on job description/criteria (standard weight)
     # The field name 'criteria' should match the Browse AI robot's output
+    description_skills = set()
     criteria_html = str(job.get('criteria', ''))
     if criteria_html:
-        soup = BeautifulSoup(criteria_html, 'html.parser')
-        description = soup.get_text().lower()
-        for skill in resume_skills:
-            if re.search(r'\b' + re.escape(skill) + r'\b', description):
-                total_score += 1
-                total_found_skills.add(skill)
-
-    return total_score, total_found_skills
+        description = _html_to_text(criteria_html).lower()
+        description_skills = _find_skills(description, skill_matcher)
+
+    # Higher weight for skills in the title
+    total_score = 2 * len(title_skills) + len(description_skills)
+    return total_score, title_skills | description_skills
@@ -4,8 +4,48 @@ import os
 import PyPDF2
 import docx
 
+from src import matcher
+
 # --- Configuration ---
-# This file does not require configuration. It accepts a file path.
+# A comprehensive, categorized list of skills for a modern software developer role.
+# Built once at import so the matcher's compiled regex for it is reused by every parse.
+TECHNICAL_SKILLS = frozenset({
+    # Programming Languages
+    'python', 'java', 'c++', 'c#', 'javascript', 'typescript', 'go', 'rust', 'kotlin', 'swift', 'ruby', 'php',
+    'html', 'css', 'sql', 'c','dart',
+
+    # Web Frameworks (Backend)
+    'django', 'flask', 'fastapi', 'node.js', 'express.js', 'spring boot', 'ruby on rails', '.net',
+
+    # Web Frameworks (Frontend & Mobile)
+    'react', 'angular', 'vue', 'vue.js', 'svelte', 'next.js', 'nuxt.js', 'flutter', 'react native',
+
+    # Databases
+    'mysql', 'postgresql', 'mssql', 'sqlite', 'oracle', 'mongodb', 'redis', 'cassandra', 'dynamodb',
+    'nosql', 'firebase', 'neo4j', 'supabase',
+
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'digitalocean', 'oracle cloud',
+    'docker', 'kubernetes', 'openshift',
+    'jenkins', 'gitlab', 'github actions', 'circleci',
+    'terraform', 'ansible', 'puppet', 'chef',
+    'prometheus', 'grafana', 'datadog', 'splunk',
+
+    # Data Science & Machine Learning
+    'pandas', 'numpy', 'scipy', 'matplotlib', 'seaborn',
+    'scikit-learn', 'tensorflow', 'pytorch', 'keras',
+    'opencv', 'nltk', 'spacy', 'hugging face', 'langchain',
+    'spark', 'hadoop', 'kafka',
+    'tableau', 'power bi', 'looker', 'streamlit',
+    'machine learning', 'deep learning', 'nlp', 'natural language processing', 'data science', 'data analysis',
+    'business intelligence', 'big data', 'data visualization', 'etl',
+
+    # Tools & Methodologies
+    'git', 'github', 'jira', 'confluence',
+    'agile', 'scrum', 'kanban','figma','kaggle',
+    'rest', 'graphql', 'soap', 'api', 'microservices', 'serverless',
+    'selenium', 'pytest', 'junit', 'jest'
+})
 
 
 # --- Main Functions ---
@@ -26,14 +66,15 @@ def extract_text_from_pdf(file_path):
 
     print(f"Reading PDF: {file_path}")
     try:
-        text = ""
+        pages_text = []
         with open(file_path, "rb") as f:
             reader = PyPDF2.PdfReader(f)
             for page in reader.pages:
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n"
-            return text
+                    pages_text.append(page_text + "\n")
+        # Join once at the end; '+=' would copy the growing text for every page
+        return "".join(pages_text)
     except Exception as e:
         print(f"An error occurred while reading the PDF: {e}")
         return ""
@@ -115,48 +156,8 @@ def extract_skills_from_text(text):
     if not text:
         return set()
 
-    # A comprehensive, categorized list of skills for a modern software developer role.
-    technical_skills = {
-        # Programming Languages
-        'python', 'java', 'c++', 'c#', 'javascript', 'typescript', 'go', 'rust', 'kotlin', 'swift', 'ruby', 'php',
-        'html', 'css', 'sql', 'c','dart',
-
-        # Web Frameworks (Backend)
-        'django', 'flask', 'fastapi', 'node.js', 'express.js', 'spring boot', 'ruby on rails', '.net',
-
-        # Web Frameworks (Frontend & Mobile)
-        'react', 'angular', 'vue', 'vue.js', 'svelte', 'next.js', 'nuxt.js', 'flutter', 'react native',
-
-        # Databases
-        'mysql', 'postgresql', 'mssql', 'sqlite', 'oracle', 'mongodb', 'redis', 'cassandra', 'dynamodb',
-        'nosql', 'firebase', 'neo4j', 'supabase',
-
-        # Cloud & DevOps
-        'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'digitalocean', 'oracle cloud',
-        'docker', 'kubernetes', 'openshift',
-        'jenkins', 'gitlab', 'github actions', 'circleci',
-        'terraform', 'ansible', 'puppet', 'chef',
-        'prometheus', 'grafana', 'datadog', 'splunk',
-
-        # Data Science & Machine Learning
-        'pandas', 'numpy', 'scipy', 'matplotlib', 'seaborn',
-        'scikit-learn', 'tensorflow', 'pytorch', 'keras',
-        'opencv', 'nltk', 'spacy', 'hugging face', 'langchain',
-        'spark', 'hadoop', 'kafka',
-        'tableau', 'power bi', 'looker', 'streamlit',
-        'machine learning', 'deep learning', 'nlp', 'natural language processing', 'data science', 'data analysis',
-        'business intelligence', 'big data', 'data visualization', 'etl',
-
-        # Tools & Methodologies
-        'git', 'github', 'jira', 'confluence',
-        'agile', 'scrum', 'kanban','figma','kaggle',
-        'rest', 'graphql', 'soap', 'api', 'microservices', 'serverless',
-        'selenium', 'pytest', 'junit', 'jest'
-    }
-
-    found_skills = {skill for skill in technical_skills if
-                    re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE)}
-    return found_skills
+    # One pass over the text for all skills instead of one regex search per skill
+    return matcher.find_skills_in_text(text.lower(), TECHNICAL_SKILLS)
 
 
 def parse_resume(file_path):
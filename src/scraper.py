@@ -18,19 +18,32 @@ from src import logger
 
 log = logger.setup_logger()
 
+# --- Configuration ---
+# How long to wait for more results after scrolling before assuming the end
+SCROLL_WAIT_SECONDS = 2
+# Poll short waits more often than Selenium's default 0.5s so they end sooner
+SCROLL_POLL_SECONDS = 0.1
+
+
+def _page_grew(driver, last_height):
+    """Returns the new scroll height if the page got taller, otherwise False."""
+    new_height = driver.execute_script("return document.body.scrollHeight")
+    return new_height if new_height != last_height else False
+
 
 def _linkedin_login(driver, email, password):
     """Handles LinkedIn login if not already logged in."""
     log.info("Navigating to LinkedIn login page.")
     driver.get("https://www.linkedin.com/login")
     try:
-        WebDriverWait(driver, 10).until(
+        # The wait returns the element, so it doesn't need to be looked up again
+        username_input = WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "username"))
         )
         log.info("Login page loaded. Entering credentials.")
-        driver.find_element(By.ID, "username").send_keys(email)
+        username_input.send_keys(email)
         driver.find_element(By.ID, "password").send_keys(password)
-        driver.find_element(By.XPATH, "//button[@type='submit']").click()
+        driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "global-nav-search"))
         )
@@ -64,11 +77,14 @@ def _get_job_links_from_search_page(driver, search_url):
     last_height = driver.execute_script("return document.body.scrollHeight")
     while True:
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)  # Wait for new jobs to load
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
+        # Wait for new jobs to load, but move on as soon as the page grows.
+        # If it doesn't grow within SCROLL_WAIT_SECONDS, all jobs are loaded.
+        try:
+            last_height = WebDriverWait(driver, SCROLL_WAIT_SECONDS, poll_frequency=SCROLL_POLL_SECONDS).until(
+                lambda d: _page_grew(d, last_height)
+            )
+        except TimeoutException:
             break
-        last_height = new_height
 
     log.info("Extracting job links from search page...")
     soup = BeautifulSoup(driver.page_source, 'html.parser')
@@ -127,6 +143,19 @@ def run_scraper(driver, resume_skills, location, email, password, additional_key
     Main scraper function. Logs into LinkedIn, constructs intelligent search
     queries from resume skills, scrapes multiple search pages, and visits
     each unique job link to get full details.
+
+    Returns:
+        list: All scraped job dictionaries. See iter_scraped_jobs() to
+              process jobs as soon as each one is scraped.
+    """
+    return list(iter_scraped_jobs(driver, resume_skills, location, email, password, additional_keywords))
+
+
+def iter_scraped_jobs(driver, resume_skills, location, email, password, additional_keywords=""):
+    """
+    Generator version of run_scraper(). Yields each job dictionary as soon as
+    its page has been scraped, so callers can filter and rank jobs while the
+    scrape is still running instead of holding every result in memory.
     """
     log.info("Starting intelligent LinkedIn scraper...")
     # --- 1. Login ---
@@ -135,7 +164,7 @@ def run_scraper(driver, resume_skills, location, email, password, additional_key
         log.warning("Not on feed page, attempting login.")
         if not _linkedin_login(driver, email, password):
             log.error("LinkedIn login failed. Aborting scrape.")
-            return []
+            return
 
     # --- 2. Construct Search Queries ---
     # Use top 5 skills from resume for focused search
@@ -167,21 +196,21 @@ def run_scraper(driver, resume_skills, location, email, password, additional_key
 
     if not all_job_links:
         log.warning("No job links found across all search queries.")
-        return []
+        return
 
     log.info(f"Found {len(all_job_links)} unique job links in total. Now scraping details...")
 
     # --- 4. Visit each unique link and scrape the details ---
-    final_jobs = []
+    scraped_count = 0
     # --- FOR TESTING: Limit the number of jobs to scrape ---
     for i, link in enumerate(list(all_job_links)): # Original line
     # for i, link in enumerate(list(all_job_links)[:10]): # Test with only 10 jobs
-        log.info(f"Processing link {i+1}/{len(list(all_job_links)[:])}")
+        log.info(f"Processing link {i+1}/{len(all_job_links)}")
         job_data = _scrape_single_job_page(driver, link)
         if job_data:
-            final_jobs.append(job_data)
+            scraped_count += 1
+            # --- 5. Hand each result to the caller as soon as it is ready ---
+            yield job_data
         time.sleep(1)  # Be respectful to LinkedIn's servers
 
-    # --- 5. Return results ---
-    log.info(f"Successfully scraped details for {len(final_jobs)} jobs.")
-    return final_jobs
\ No newline at end of file
+    log.info(f"Successfully scraped details for {scraped_count} jobs.")
\ No newline at end of file
@@ -7,19 +7,20 @@
 # --------------------------------------------------------------------------
 
 import os
-import json
+import atexit
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import streamlit as st
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
 # --- Local Module Imports ---
+# scraper, automator and llm_helper pull in Selenium and HTTP clients, so they
+# are imported where they are used to keep review-only reruns light.
 from src import parser
 from src import matcher
-from src import scraper
-from src import automator
 from src import database
 from src import logger
-from src import llm_helper
 
 # --- 1. CONFIGURATION & INITIALIZATION ---
 
@@ -30,10 +31,23 @@ load_dotenv()
 BROWSEAI_API_KEY = os.getenv("BROWSEAI_API_KEY")
 LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL")
 LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
+INSERT_BATCH_SIZE = 50  # Relevant jobs are written to the database in batches of this size
+BROWSER_ACQUIRE_TIMEOUT = 60  # Seconds to wait for a free pooled browser before giving up
 
-# Initialize logger and database
-log = logger.setup_logger()
-database.init_db()  # Ensure the database and tables are created on startup
+# Initialize logger and database once per process rather than on every rerun
+@st.cache_resource(show_spinner=False)
+def _get_logger():
+    return logger.setup_logger()
+
+
+@st.cache_resource(show_spinner=False)
+def _init_database():
+    database.init_db()  # Ensure the database and tables are created on startup
+    return True
+
+
+log = _get_logger()
+_init_database()
 
 
 
@@ -61,27 +75,116 @@ def show_success(message):
     st.success(message)
 
 
+def job_card_markdown(job):
+    """
+    Builds the static header of a job card (title, company, location and
+    matched skills) as a single markdown block, so each card sends one
+    element to the frontend instead of four.
+    """
+    lines = [
+        f"### {job.get('title', 'No Title')}",
+        f"**Company:** {job.get('company', 'N/A')}",
+        f"**Location:** {job.get('location', 'N/A')}",
+    ]
+    matched_skills_str = job.get('matched_skills')
+    if matched_skills_str:
+        lines.append(f"**Matched Skills:** {matched_skills_str}")
+    return "\n\n".join(lines)
+
+
+def job_ui_state(job_id):
+    """Returns the dict holding a job's UI state, creating it on first use."""
+    return st.session_state.job_ui.setdefault(job_id, {})
+
+
 # --- 2. BACKEND LOGIC: FETCHING & PARSING ---
 
+@st.cache_data(show_spinner=False)
+def _cached_parse(path, mtime, size):
+    """
+    Parses the resume once per file version.
+    The file's modification time and size are part of the cache key, so a
+    re-uploaded resume is parsed again while repeated clicks reuse the cached result.
+    """
+    return parser.parse_resume(path)
+
+
+def parse_resume_cached(path):
+    """
+    Returns the parsed resume for the given path, using the cache when possible.
+    The latest result is also kept in session state, which skips the copy
+    st.cache_data makes on every hit when the same resume is used repeatedly.
+    """
+    try:
+        file_stat = os.stat(path)
+    except (OSError, TypeError):
+        # Missing file or path; let the parser report it
+        return parser.parse_resume(path)
+
+    cache_key = (path, file_stat.st_mtime, file_stat.st_size)
+    cached = st.session_state.get('parsed_resume')
+    if cached and cached[0] == cache_key:
+        return cached[1]
+
+    resume_data = _cached_parse(*cache_key)
+    st.session_state.parsed_resume = (cache_key, resume_data)
+    return resume_data
+
+
+# Job lists are cached per database version, so reruns reuse them until
+# something is written. The TTL picks up writes made by other processes.
+@st.cache_data(show_spinner=False, max_entries=16, ttl=300)
+def _load_jobs(status, version, limit=None, offset=0):
+    """Queries the jobs with the given status; 'version' only keys the cache."""
+    return database.get_jobs_by_status(status, limit=limit, offset=offset)
+
+
+@st.cache_data(show_spinner=False, max_entries=16, ttl=300)
+def _count_jobs(status, version):
+    """Counts the jobs with the given status; 'version' only keys the cache."""
+    return database.count_jobs_by_status(status)
+
+
+def load_jobs(status, limit=None, offset=0):
+    """Returns the jobs with the given status, served from cache while the DB is unchanged."""
+    return _load_jobs(status, database.get_db_version(), limit, offset)
 
-def find_relevant_jobs(jobs_list, resume_skills):
-    """Scores and ranks jobs based on how well they match skills from the resume."""
-    if not jobs_list or not resume_skills:
-        return []
 
-    scored_jobs = []
-    for job in jobs_list:
-        # Delegate scoring logic to the dedicated matcher module
-        score, matched_skills = matcher.score_job_relevance(job, resume_skills)
+def count_jobs(status):
+    """Returns the number of jobs with the given status, served from cache while the DB is unchanged."""
+    return _count_jobs(status, database.get_db_version())
 
-        if score > 2:  # Minimum relevance threshold
-            job_with_score = job.copy()
-            job_with_score['score'] = score
-            # Store the skills that were found for potential display later
-            job_with_score['matched_skills'] = sorted(list(matched_skills))
-            scored_jobs.append(job_with_score)
 
-    return sorted(scored_jobs, key=lambda x: x['score'], reverse=True)
+@st.cache_resource
+def get_browser_pool():
+    """Returns the process-wide pool of headless browsers used for scraping."""
+    from src import automator
+    browser_pool = automator.BrowserPool(headless=True)
+    # Pooled browsers outlive each fetch, so quit them when the server stops
+    atexit.register(browser_pool.close_all)
+    return browser_pool
+
+
+@st.cache_data(show_spinner=False)
+def _talking_points_prompt(job_id, skills, _job):
+    """Builds the talking-points prompt once per (job, skill set) pair."""
+    from src import llm_helper
+    return llm_helper.generate_talking_points_prompt(_job, skills)
+
+
+def score_job(job, resume_skills):
+    """
+    Scores a single job against the resume skills.
+    Returns a copy of the job with 'score' and 'matched_skills' added, or None
+    if it falls below the relevance threshold.
+    """
+    # Delegate scoring logic to the dedicated matcher module
+    score, matched_skills = matcher.score_job_relevance(job, resume_skills)
+
+    if score > 2:  # Minimum relevance threshold
+        # Store the skills that were found for potential display later
+        return {**job, 'score': score, 'matched_skills': sorted(matched_skills)}
+    return None
 
 
 # --- 4. STREAMLIT UI ---
@@ -163,37 +266,36 @@ div[data-testid="stExpander"] button[kind="secondary"]:focus {
     color: #212529 !important;
 }
 
-/* Compact spacing for job criteria expander */
-div[data-testid="stExpander"] div[data-testid="stMarkdown"] p {
+/* Compact spacing for job criteria and expanders */
+div[data-testid="stExpander"] div[data-testid="stMarkdown"] p,
+div[class*="st-key-criteria_"] div[data-testid="stMarkdown"] p {
     margin-bottom: 0.25rem !important;
     line-height: 1.3 !important;
 }
-div[data-testid="stExpander"] div[data-testid="stMarkdown"] ul {
+div[data-testid="stExpander"] div[data-testid="stMarkdown"] ul,
+div[class*="st-key-criteria_"] div[data-testid="stMarkdown"] ul {
     margin-top: 0.25rem !important;
     margin-bottom: 0.5rem !important;
     padding-left: 1.2rem !important;
 }
-div[data-testid="stExpander"] div[data-testid="stMarkdown"] li {
+div[data-testid="stExpander"] div[data-testid="stMarkdown"] li,
+div[class*="st-key-criteria_"] div[data-testid="stMarkdown"] li {
     margin-bottom: 0.1rem !important;
 }
 </style>
 """
-st.markdown(ui_enhancements_css, unsafe_allow_html=True)
+# st.html sends the style block as-is, skipping the markdown parser, and a
+# style-only block takes no vertical space. It still has to be emitted on
+# every run: Streamlit drops elements a rerun doesn't re-create.
+st.html(ui_enhancements_css)
 
 st.markdown("Focusing on **LinkedIn**, **Indeed**, and **Direct Company Portals** for the Indian Tech Market.")
 
 # Initialize session state
-if 'scraped_jobs' not in st.session_state:
-    st.session_state.scraped_jobs = []
-if 'relevant_jobs' not in st.session_state:
-    st.session_state.relevant_jobs = []
+# Approved/rejected jobs are not tracked here; the 'status' column in the DB
+# is the single source of truth.
 if 'my_skills' not in st.session_state:
-    st.session_state.my_skills = set()
-# Removed approved/rejected from session_state as DB will now handle persistence
-if 'approved_jobs' not in st.session_state:
-    st.session_state.approved_jobs = set()
-if 'rejected_jobs' not in st.session_state:
-    st.session_state.rejected_jobs = set()
+    st.session_state.my_skills = frozenset()
 if 'driver' not in st.session_state:
     st.session_state.driver = None
 if 'resume_path' not in st.session_state:
@@ -202,6 +304,9 @@ if 'fetching_jobs' not in st.session_state:
     st.session_state.fetching_jobs = False
 if 'current_page' not in st.session_state:
     st.session_state.current_page = 1
+# Per-job UI state (AI insights, generated application text), keyed by job ID
+if 'job_ui' not in st.session_state:
+    st.session_state.job_ui = {}
 
 # --- Sidebar Controls ---
 with st.sidebar:
@@ -214,22 +319,35 @@ with st.sidebar:
 
     # Handle the file upload and store its path in the session state
     if uploaded_file is not None:
-        if not os.path.exists("temp"):
-            os.makedirs("temp")
-        # Save the file to a temporary location
-        temp_path = os.path.join("temp", uploaded_file.name)
-        with open(temp_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        # Store the path for use across the app
-        st.session_state.resume_path = temp_path
+        # The widget returns the same file on every rerun; only write it to disk
+        # when a new file is uploaded (file_id changes even for same-named files).
+        if (st.session_state.get('uploaded_file_id') != uploaded_file.file_id
+                or not os.path.exists(st.session_state.resume_path or "")):
+            if not os.path.exists("temp"):
+                os.makedirs("temp")
+            # Save the file to a temporary location
+            temp_path = os.path.join("temp", uploaded_file.name)
+            with open(temp_path, "wb") as f:
+                f.write(uploaded_file.getbuffer())
+            # Store the path for use across the app
+            st.session_state.resume_path = temp_path
+            st.session_state.uploaded_file_id = uploaded_file.file_id
+            # A fetch usually follows an upload, so start a scraping browser now
+            get_browser_pool().prewarm()
         st.success(f"Resume '{uploaded_file.name}' uploaded successfully!")
 
     st.markdown("---")
     st.header("⚙️ 2. Scraper Settings")
-    search_term = st.text_input("Additional Keywords (e.g., 'Remote', 'Fintech')", value="")
-    location = st.text_input("Location", value="India")
-
-    if st.button("🚀 Fetch & Rank Jobs", type="primary", help="Searches for jobs based on your resume and settings."):
+    # A form batches the settings so editing them doesn't rerun the whole app;
+    # only submitting does.
+    with st.form("scraper_settings", border=False):
+        search_term = st.text_input("Additional Keywords (e.g., 'Remote', 'Fintech')", value="")
+        location = st.text_input("Location", value="India")
+        fetch_clicked = st.form_submit_button(
+            "🚀 Fetch & Rank Jobs", type="primary", help="Searches for jobs based on your resume and settings."
+        )
+
+    if fetch_clicked:
         if not st.session_state.resume_path:
             show_error("Please upload your resume before fetching jobs.")
         else:
@@ -251,94 +369,145 @@ if st.session_state.get('fetching_jobs'):
     with st.spinner("Please wait... Fetching jobs and ranking them against your profile. This might take a minute."):
         log.info("'Fetch & Rank Jobs' triggered.")
 
-        # --- PARSE RESUME ---
-        log.info("Parsing resume to identify your skills...")
-        resume_data = parser.parse_resume(st.session_state.resume_path)
-        if resume_data and resume_data.get('skills'):
-            st.session_state.my_skills = resume_data['skills']
-            log.info(f"Resume parsed. Found {len(st.session_state.my_skills)} skills.")
-        else:
-            log.error("Failed to parse resume or find skills.")
-            show_error("Could not find skills in the resume. Aborting.")
-            st.session_state.fetching_jobs = False
-            st.stop()
-
-        # --- SCRAPE & PROCESS (Now always live and headless) ---
-        if st.session_state.my_skills:
-            log.info(f"Running intelligent LinkedIn search based on your resume...")
-            
-            # Use a temporary, isolated headless driver for scraping to avoid conflicts
-            # with the user-facing browser used for applying.
-            scraper_driver = None
-            try:
-                log.info("Initializing temporary headless browser for scraping...")
-                scraper_driver = automator.initialize_driver(headless=True)
-
-                if scraper_driver:
-                    st.session_state.scraped_jobs = scraper.run_scraper(
-                        scraper_driver, st.session_state.my_skills, location,
-                        email=LINKEDIN_EMAIL, password=LINKEDIN_PASSWORD, additional_keywords=search_term
-                    )
-                else:
-                    show_error("Could not initialize the background browser. Scraping aborted.")
-                    st.session_state.scraped_jobs = []
-            finally:
-                if scraper_driver:
-                    scraper_driver.quit()
-                    log.info("Temporary scraper browser session closed.")
-
-            # --- DATABASE INTEGRATION & RANKING ---
-            if st.session_state.scraped_jobs:
-                log.info("Filtering and ranking new jobs...")
-                processed_urls = {job['job_url'] for job in database.get_all_jobs()}
-                unprocessed_jobs = []
-                for job in st.session_state.scraped_jobs:
-                    job['job_url'] = job.get('link')
-                    if job.get('job_url') and job['job_url'] not in processed_urls:
-                        unprocessed_jobs.append(job)
-
-                log.info(f"Scraped {len(st.session_state.scraped_jobs)} total jobs. Found {len(unprocessed_jobs)} new jobs to process.")
-
-                if unprocessed_jobs:
-                    ranked_jobs = find_relevant_jobs(unprocessed_jobs, st.session_state.my_skills)
-                    log.info(f"Found {len(ranked_jobs)} relevant jobs after ranking.")
-
-                    newly_added_count = 0
-                    for job in ranked_jobs:
-                        if database.add_job(job):
-                            newly_added_count += 1
-                    show_success(f"Success! Added {newly_added_count} new relevant jobs to the database for your review.")
-                else:
-                    show_warning("No new jobs found that match your profile. Try different keywords or check back later.")
+        # Use an isolated headless driver from the pool for scraping to avoid conflicts
+        # with the user-facing browser used for applying. The scraper needs the
+        # resume skills, but acquiring the browser does not, so do it in the
+        # background while the resume is being parsed.
+        log.info("Acquiring headless browser for scraping...")
+        browser_pool = get_browser_pool()
+        driver_executor = ThreadPoolExecutor(max_workers=1)
+        driver_future = driver_executor.submit(partial(browser_pool.acquire, timeout=BROWSER_ACQUIRE_TIMEOUT))
+        driver_executor.shutdown(wait=False)
+
+        def _release_scraper_driver(future):
+            """Hands the scraper's browser back to the pool once it is available."""
+            if future.exception() is None:
+                browser_pool.release(future.result())
+                log.info("Scraper browser returned to the pool.")
+
+        # Everything from here on runs inside try/finally, so the browser goes back
+        # to the pool however the fetch ends, including st.stop() and reruns.
+        try:
+            # --- PARSE RESUME ---
+            log.info("Parsing resume to identify your skills...")
+            resume_data = parse_resume_cached(st.session_state.resume_path)
+            if resume_data and resume_data.get('skills'):
+                # Lowercased and frozen once, so the matcher and the prompt cache can
+                # use it as-is for every job
+                st.session_state.my_skills = frozenset(skill.lower() for skill in resume_data['skills'])
+                log.info(f"Resume parsed. Found {len(st.session_state.my_skills)} skills.")
             else:
-                log.warning("Scraper returned no jobs.")
+                log.error("Failed to parse resume or find skills.")
+                show_error("Could not find skills in the resume. Aborting.")
+                st.stop()
+
+            # --- SCRAPE & PROCESS (Now always live and headless) ---
+            if st.session_state.my_skills:
+                log.info(f"Running intelligent LinkedIn search based on your resume...")
+                from src import scraper
+
+                processed_urls = database.get_known_urls()
+                scraped_count = 0
+                new_count = 0
+                relevant_count = 0
+                newly_added_count = 0
+                pending_jobs = []
+                progress = st.empty()
+                try:
+                    try:
+                        scraper_driver = driver_future.result()
+                    except queue.Empty:
+                        log.error(f"No pooled browser became free within {BROWSER_ACQUIRE_TIMEOUT}s.")
+                        scraper_driver = None
+                    except Exception as e:
+                        log.error(f"Could not start the scraper browser: {e}")
+                        scraper_driver = None
+
+                    if scraper_driver:
+                        # --- DATABASE INTEGRATION & RANKING ---
+                        # Jobs are filtered, scored and saved in batches as they are
+                        # scraped, so at most one batch is held in memory and results
+                        # survive an interrupted scrape.
+                        for job in scraper.iter_scraped_jobs(
+                            scraper_driver, st.session_state.my_skills, location,
+                            email=LINKEDIN_EMAIL, password=LINKEDIN_PASSWORD, additional_keywords=search_term
+                        ):
+                            scraped_count += 1
+                            job['job_url'] = job.get('link')
+                            if job.get('job_url') and job['job_url'] not in processed_urls:
+                                # Remember it so a repeat within this scrape isn't scored twice
+                                processed_urls.add(job['job_url'])
+                                new_count += 1
+                                job_with_score = score_job(job, st.session_state.my_skills)
+                                if job_with_score:
+                                    relevant_count += 1
+                                    pending_jobs.append(job_with_score)
+                                    if len(pending_jobs) >= INSERT_BATCH_SIZE:
+                                        newly_added_count += database.add_jobs(pending_jobs)
+                                        pending_jobs.clear()
+                            progress.caption(f"Scraped {scraped_count} jobs so far, {relevant_count} relevant.")
+                    else:
+                        show_error("Could not initialize the background browser. Scraping aborted.")
+                finally:
+                    if pending_jobs:
+                        newly_added_count += database.add_jobs(pending_jobs)
+                    progress.empty()
+
+                if scraped_count:
+                    log.info(f"Scraped {scraped_count} total jobs. Found {new_count} new jobs to process.")
+
+                    if relevant_count:
+                        log.info(f"Found {relevant_count} relevant jobs after ranking.")
+                        show_success(f"Success! Added {newly_added_count} new relevant jobs to the database for your review.")
+                    else:
+                        show_warning("No new jobs found that match your profile. Try different keywords or check back later.")
+                else:
+                    log.warning("Scraper returned no jobs.")
+        finally:
+            # If the browser is still starting, it is released as soon as it is ready
+            driver_future.add_done_callback(_release_scraper_driver)
+            # Never leave the flag set, or every later rerun would start the fetch again
+            st.session_state.fetching_jobs = False
 
-    # Reset the flag after the process is complete
-    # Also reset to page 1 to show the newest results first
-    st.session_state.fetching_jobs = False
+    # The flag was reset above; go back to page 1 to show the newest results first
     st.session_state.current_page = 1
     st.rerun()
 
 # --- Main Content Area ---
-# Fetch jobs with 'found' status directly from the database for display
-jobs_to_display = database.get_jobs_by_status('found')
+# Fetch jobs with 'found' status directly from the database for display.
+# Only the current page is loaded; the total comes from a COUNT query.
+JOBS_PER_PAGE = 9  # 9 jobs per page fits the 3-column grid perfectly.
+total_jobs = count_jobs('found')
 
-if not jobs_to_display and not st.session_state.get('fetching_jobs'):
+if not total_jobs and not st.session_state.get('fetching_jobs'):
     st.info("No new jobs to display. Click 'Fetch & Rank Jobs' in the sidebar to search for more.")
 else:
     # --- Pagination Setup ---
-    # We use 9 jobs per page to fit the 3-column grid perfectly.
-    JOBS_PER_PAGE = 9
-    total_jobs = len(jobs_to_display)
-
     if total_jobs > 0:
         total_pages = (total_jobs + JOBS_PER_PAGE - 1) // JOBS_PER_PAGE
+        # Stay in range when the last job on the last page was approved or skipped
+        st.session_state.current_page = min(st.session_state.current_page, total_pages)
 
         start_index = (st.session_state.current_page - 1) * JOBS_PER_PAGE
-        end_index = start_index + JOBS_PER_PAGE
-        jobs_on_this_page = jobs_to_display[start_index:end_index]
+        jobs_on_this_page = load_jobs('found', limit=JOBS_PER_PAGE, offset=start_index)
 
         st.header(f"📬 {total_jobs} New Jobs Found For Review")
+
+        # Insights for every card on the page can be requested at once; the LLM
+        # calls are independent network round-trips, so they run concurrently.
+        pending_insights = [job for job in jobs_on_this_page
+                            if job.get('id') and 'insights' not in job_ui_state(job['id'])]
+        if pending_insights and st.button("💡 Generate AI Insights for this page", key="page_insights"):
+            with st.spinner(f"Asking the AI for talking points on {len(pending_insights)} jobs..."):
+                from src import llm_helper
+                log.info(f"Generating AI insights for {len(pending_insights)} jobs on page {st.session_state.current_page}")
+                prompts = [_talking_points_prompt(job['id'], st.session_state.my_skills, job)
+                           for job in pending_insights]
+                with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+                    results = list(executor.map(llm_helper.get_ai_insights, prompts))
+                for job, insights in zip(pending_insights, results):
+                    job_ui_state(job['id'])['insights'] = insights
+            st.rerun()
         st.markdown("---")
 
         # Display jobs in a grid
@@ -351,28 +520,29 @@ else:
 
             with cols[i % 3]:
                 with st.container(border=True):
-                    st.subheader(job.get('title', 'No Title'))
-                    st.write(f"**Company:** {job.get('company', 'N/A')}")
-                    st.write(f"**Location:** {job.get('location', 'N/A')}")
-
-                    matched_skills_str = job.get('matched_skills')
-                    if matched_skills_str:
-                        st.write(f"**Matched Skills:** {matched_skills_str}")
+                    st.markdown(job_card_markdown(job))
 
-                    with st.expander("Show Job Criteria"):
-                        st.markdown(job.get('criteria', 'Not available.'), unsafe_allow_html=True)
+                    # The description HTML is the largest part of a card, and an expander
+                    # sends it on every rerun even while collapsed; a toggle only sends
+                    # it for the cards the user actually opened.
+                    if st.toggle("Show Job Criteria", key=f"show_criteria_{job_id}"):
+                        with st.container(key=f"criteria_{job_id}"):
+                            st.markdown(job.get('criteria', 'Not available.'), unsafe_allow_html=True)
 
                     with st.expander("💡 AI Insights"):
                         # Generate insights on-demand the first time the expander is opened
-                        if f"insights_{job_id}" in st.session_state:
-                            st.markdown(st.session_state[f"insights_{job_id}"])
+                        job_ui = job_ui_state(job_id)
+                        insights = job_ui.get('insights')
+                        if insights is not None:
+                            st.markdown(insights)
                         else:
                             if st.button("Generate AI Insights", key=f"gen_insights_{job_id}"):
                                 with st.spinner("Asking the AI for talking points..."):
                                     log.info(f"Generating AI insights for: {job.get('title')}")
-                                    prompt = llm_helper.generate_talking_points_prompt(job, st.session_state.my_skills)
+                                    from src import llm_helper
+                                    prompt = _talking_points_prompt(job_id, st.session_state.my_skills, job)
                                     insights = llm_helper.get_ai_insights(prompt)
-                                    st.session_state[f"insights_{job_id}"] = insights
+                                    job_ui['insights'] = insights
                                     st.rerun()
 
                     c1, c2 = st.columns(2)
@@ -402,7 +572,8 @@ else:
                     st.rerun()
 
 # --- Section for jobs ready to be applied for ---
-jobs_to_apply = database.get_jobs_by_status('applying')
+# Usually nothing is queued, so check with a cheap COUNT before loading rows
+jobs_to_apply = load_jobs('applying') if count_jobs('applying') else []
 
 if jobs_to_apply:
     st.header("🎯 Ready to Apply")
@@ -417,8 +588,9 @@ if jobs_to_apply:
             st.subheader(f"Generate text for: {job.get('title')} at {job.get('company')}")
 
             # Use session state to store the generated text for each job
-            if f"app_text_{job_id}" not in st.session_state:
-                st.session_state[f"app_text_{job_id}"] = ""
+            job_ui = job_ui_state(job_id)
+            textarea_key = f"textarea_{job_id}"
+            app_text = job_ui.setdefault('app_text', "")
 
             if st.button("📝 Generate Application Text", key=f"generate_{job_id}"):
                 if not st.session_state.resume_path:
@@ -426,22 +598,24 @@ if jobs_to_apply:
                     st.stop()
 
                 with st.spinner("🤖 AI is writing your application summary..."):
+                    from src import llm_helper
                     # Use the enhanced parser that returns a dictionary
-                    resume_data = parser.parse_resume(st.session_state.resume_path)
+                    resume_data = parse_resume_cached(st.session_state.resume_path)
                     if resume_data and resume_data.get('full_text'):
                         resume_text = resume_data['full_text']
                         prompt = llm_helper.generate_application_text_prompt(job, resume_text)
                         generated_text = llm_helper.get_ai_insights(prompt)
-                        st.session_state[f"app_text_{job_id}"] = generated_text
+                        app_text = generated_text
                     else:
-                        st.session_state[f"app_text_{job_id}"] = "Error: Could not read resume text to generate content."
+                        app_text = "Error: Could not read resume text to generate content."
+                    job_ui['app_text'] = app_text
 
-            if st.session_state[f"app_text_{job_id}"]:
+            if app_text:
                 st.text_area(
                     "Review and edit the generated text:",
-                    value=st.session_state[f"app_text_{job_id}"],
+                    value=app_text,
                     height=250,
-                    key=f"textarea_{job_id}"
+                    key=textarea_key
                 )
 
                 c1, c2, _ = st.columns([1, 1, 3])
@@ -453,19 +627,27 @@ if jobs_to_apply:
 
                     with st.spinner("Gathering data and starting browser automation..."):
                         log.info(f"Starting automation for: {job.get('title')}")
-                        resume_data = parser.parse_resume(st.session_state.resume_path)
+                        resume_data = parse_resume_cached(st.session_state.resume_path)
                         if not resume_data:
                             show_error("Could not parse resume. Aborting automation.")
                             st.stop()
 
                         # Get the latest edited text from the text area
-                        edited_application_text = st.session_state[f"textarea_{job_id}"]
+                        edited_application_text = st.session_state[textarea_key]
 
                         # --- TRIGGER THE AUTOMATION ---
+                        from src import automator
                         # Ensure a browser session is active, reusing or creating as needed.
                         # This is where the app will "wait" for the user, by keeping the
                         # browser window open for them to log in.
-                        if st.session_state.driver is None:
+                        # A window the user has closed can't be reused, so only then start a new one.
+                        if not automator.is_driver_alive(st.session_state.driver):
+                            if st.session_state.driver is not None:
+                                # Quit the stale session so its chromedriver process doesn't leak
+                                try:
+                                    st.session_state.driver.quit()
+                                except Exception as e:
+                                    log.warning(f"Could not close the stale browser session: {e}")
                             with st.spinner("Initializing new browser session..."):
                                 st.session_state.driver = automator.initialize_driver()
 
@@ -482,5 +664,5 @@ if jobs_to_apply:
                 if c2.button("👎 Cancel", key=f"cancel_apply_{job_id}"):
                     # Move the job back to the 'found' queue for re-review
                     database.update_job_status(job_id, 'found')
-                    st.session_state[f"app_text_{job_id}"] = ""  # Clear the generated text
+                    job_ui['app_text'] = ""  # Clear the generated text
                     st.rerun()